@@ -2,22 +2,17 @@
 
 import logging
 import time
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Annotated, Optional
 
-import orjson
 import typer
 from rich.console import Console
-from rich.logging import RichHandler
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-
-from src.config import load_config
-from src.fetchers.sse import SseFetcher
-from src.models.config import SseConfig
-from src.normalizers.sse import normalize_sse_record
-from src.storage import UniverseStorage
 
+# The fetch pipeline (httpx, pydantic, tenacity via SseFetcher) and orjson
+# are imported inside the commands that need them, so `--help` and light
+# commands like `list` do not pay the full import graph at startup.
 
 app = typer.Typer(help="Stock universe fetching commands")
 console = Console()
@@ -25,6 +20,8 @@ console = Console()
 
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging with rich handler."""
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
@@ -56,6 +53,13 @@ def fetch_universe(
         bool,
         typer.Option("--include-raw", help="Include raw data in output")
     ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Only write symbols not present in the latest snapshot (delta snapshot)"
+        )
+    ] = False,
     verbose: Annotated[
         bool,
         typer.Option("--verbose", "-v", help="Enable verbose logging")
@@ -66,6 +70,20 @@ def fetch_universe(
     Example:
         stock-bot universe fetch --exchange sse --stock-type 1
     """
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+    )
+
+    from src.config import load_config
+    from src.fetchers.sse import SseFetcher
+    from src.models.config import SseConfig
+    from src.normalizers.sse import category_for_stock_type, normalize_sse_record
+    from src.storage import UniverseStorage
+
     setup_logging(verbose)
     logger = logging.getLogger(__name__)
 
@@ -97,6 +115,17 @@ def fetch_universe(
     output_dir = output or Path("data/universe")
     storage = UniverseStorage(output_dir)
 
+    # Incremental mode: skip symbols already known from the snapshot
+    # chain (deltas unioned back to the last full snapshot)
+    prev_symbols = None
+    base_snapshot = None
+    if incremental:
+        loaded = storage.load_latest_symbols("Shanghai_Stocks")
+        if loaded is None:
+            console.print("[yellow]No previous snapshot found, doing a full fetch[/yellow]")
+        else:
+            prev_symbols, base_snapshot = loaded
+
     asof = datetime.now(timezone.utc)
     console.print(f"\n[bold]Stock Universe Fetch[/bold]")
     console.print(f"  Exchange: {exchange.upper()}")
@@ -108,12 +137,15 @@ def fetch_universe(
 
     start_time = time.time()
     total_records = 0
-    failed_pages = 0
-    errors: list[dict] = []
+    errors: deque[dict] = deque(maxlen=10)
 
     try:
-        with SseFetcher(config) as fetcher:
-            with storage.open_writer(asof, "Shanghai_Stocks") as writer:
+        with SseFetcher(config, prev_snapshot_symbols=prev_symbols) as fetcher:
+            with storage.open_writer(
+                asof,
+                "Shanghai_Stocks",
+                categories=[category_for_stock_type(stock_type)],
+            ) as writer:
                 with Progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
@@ -122,41 +154,60 @@ def fetch_universe(
                     console=console,
                 ) as progress:
                     task = progress.add_task("Fetching...", total=None)
+                    last_update = 0.0
 
-                    for raw_record, source_url, record_asof in fetcher.iter_raw_records(asof):
-                        try:
-                            normalized = normalize_sse_record(
-                                raw_record,
-                                source_url,
-                                record_asof,
-                                stock_type=stock_type,
-                                include_raw=include_raw,
-                            )
-                            writer.write_record(normalized)
-                            total_records += 1
+                    for batch, source_url, record_asof in fetcher.iter_raw_pages(asof):
+                        normalized = []
+                        for raw_record in batch:
+                            try:
+                                normalized.append(normalize_sse_record(
+                                    raw_record,
+                                    source_url,
+                                    record_asof,
+                                    stock_type=stock_type,
+                                    include_raw=include_raw,
+                                ))
+                            except Exception as e:
+                                logger.warning(f"Failed to normalize record: {e}")
+                                errors.append({
+                                    "type": "normalize_error",
+                                    "error": str(e),
+                                })
+
+                        writer.write_records(normalized)
+                        total_records += len(normalized)
 
+                        # Throttle redraws to 10Hz; pages can arrive in
+                        # bursts and each update formats + repaints.
+                        now = time.monotonic()
+                        if now - last_update > 0.1:
                             progress.update(
                                 task,
                                 description=f"Fetching... {total_records} records"
                             )
-                        except Exception as e:
-                            logger.warning(f"Failed to normalize record: {e}")
-                            if len(errors) < 10:
-                                errors.append({
-                                    "type": "normalize_error",
-                                    "error": str(e),
-                                })
+                            last_update = now
+
+                    progress.update(
+                        task,
+                        description=f"Fetching... {total_records} records"
+                    )
 
-                # Build and write manifest
+                # Build and write manifest; fetcher-side stats (failed
+                # pages, api_error samples) come from its progress, CLI
+                # normalize errors are merged on top
                 duration = time.time() - start_time
+                fetch_progress = fetcher.last_progress
+                fetch_errors = list(fetch_progress.errors) if fetch_progress else []
                 manifest = storage.build_manifest(
                     exchange="Shanghai_Stocks",
                     asof=asof,
                     config=config,
                     writer=writer,
                     duration_seconds=duration,
-                    failed_pages=failed_pages,
-                    errors=errors,
+                    failed_pages=fetch_progress.failed_pages if fetch_progress else 0,
+                    errors=fetch_errors + list(errors),
+                    skipped_existing=fetch_progress.skipped_existing if fetch_progress else 0,
+                    base_snapshot=base_snapshot,
                 )
                 manifest.stats.total_pages = fetcher.client._last_request_time > 0 and 1 or 0
                 storage.write_manifest(asof, manifest)
@@ -166,6 +217,11 @@ def fetch_universe(
         console.print()
         console.print("[bold green]✓ Fetch completed[/bold green]")
         console.print(f"  Records: {total_records}")
+        if base_snapshot is not None:
+            console.print(
+                f"  Skipped existing: {manifest.stats.skipped_existing} "
+                f"(delta vs {base_snapshot})"
+            )
         console.print(f"  Categories: {len(manifest.stats.categories)}")
         console.print(f"  Duration: {duration:.1f}s")
         console.print(f"  Output: {storage.create_snapshot_dir(asof)}")
@@ -190,6 +246,8 @@ def list_snapshots(
     ] = None,
 ) -> None:
     """List available universe snapshots."""
+    import orjson
+
     output_dir = output or Path("data/universe")
 
     if not output_dir.exists():
@@ -203,17 +261,31 @@ def list_snapshots(
 
     console.print(f"\n[bold]Available Snapshots[/bold] ({output_dir})\n")
     for snapshot in snapshots:
+        summary_path = snapshot / "manifest_summary.json"
         manifest_path = snapshot / "manifest.json"
-        if manifest_path.exists():
-            with open(manifest_path, "rb") as f:
-                manifest = orjson.loads(f.read())
+
+        if summary_path.exists():
+            summary = orjson.loads(summary_path.read_bytes())
+        elif manifest_path.exists():
+            # Older snapshots have no summary; fall back to full manifest
+            manifest = orjson.loads(manifest_path.read_bytes())
             stats = manifest.get("stats", {})
-            console.print(f"  {snapshot.name}")
-            console.print(f"    Exchange: {manifest.get('exchange', 'N/A')}")
-            console.print(f"    Records: {stats.get('unique_records', 'N/A')}")
-            console.print(f"    Duration: {stats.get('duration_seconds', 0):.1f}s")
+            summary = {
+                "exchange": manifest.get("exchange"),
+                "unique_records": stats.get("unique_records"),
+                "duration_seconds": stats.get("duration_seconds", 0),
+                "incremental": manifest.get("incremental", False),
+            }
         else:
             console.print(f"  {snapshot.name} (no manifest)")
+            console.print()
+            continue
+
+        marker = " (delta)" if summary.get("incremental") else ""
+        console.print(f"  {snapshot.name}{marker}")
+        console.print(f"    Exchange: {summary.get('exchange', 'N/A')}")
+        console.print(f"    Records: {summary.get('unique_records', 'N/A')}")
+        console.print(f"    Duration: {summary.get('duration_seconds', 0):.1f}s")
         console.print()
 
 
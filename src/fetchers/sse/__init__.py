@@ -1,6 +1,11 @@
 """SSE (Shanghai Stock Exchange) fetcher module."""
 
-from .client import SseCommonQueryClient
-from .fetcher import SseFetcher
+from .client import SseAsyncCommonQueryClient, SseCommonQueryClient
+from .fetcher import SseAsyncFetcher, SseFetcher
 
-__all__ = ["SseCommonQueryClient", "SseFetcher"]
+__all__ = [
+    "SseAsyncCommonQueryClient",
+    "SseAsyncFetcher",
+    "SseCommonQueryClient",
+    "SseFetcher",
+]
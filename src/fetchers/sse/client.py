@@ -1,12 +1,13 @@
 """SSE commonQuery.do JSONP client."""
 
-import json
+import asyncio
 import random
 import re
 import time
 from typing import Any
 
 import httpx
+import orjson
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -16,6 +17,44 @@ from tenacity import (
 
 from src.models.config import SseConfig
 
+# Lenient JSONP fallback: any callback name wrapping the payload. Compiled
+# once at import; the strict slice-based path in _parse_jsonp avoids regex.
+_LENIENT_JSONP_RE = re.compile(rb"^\w+\s*\(\s*(.*)\s*\);?\s*$", re.DOTALL)
+
+# UTF-8 bytes of 系统繁忙 ("system busy")
+_SYSTEM_BUSY = "系统繁忙".encode()
+
+
+def _snippet(payload: bytes, limit: int = 500) -> str:
+    """Decode a short diagnostic snippet from response bytes."""
+    return payload[:limit].decode("utf-8", errors="replace")
+
+
+def _reject_error_payload(payload: bytes) -> None:
+    """Raise early for gateway error responses.
+
+    Error markers always sit near the start of the body, so only a
+    bounded prefix is inspected — no full-payload scan or decode before
+    handing bytes to the JSON parser.
+
+    Raises:
+        SseApiError: If the payload is an HTML page or error banner
+    """
+    if payload.startswith(b"<!") or payload.startswith(b"<html"):
+        raise SseApiError("SSE API returned HTML error page", _snippet(payload))
+
+    head = payload[:2048]
+    if b"System Error" in head or _SYSTEM_BUSY in head:
+        raise SseApiError("SSE API returned System Error", _snippet(payload))
+
+# Keep connections alive across pages so repeated requests reuse one
+# TCP+TLS session (and HTTP/2 can multiplex concurrent page fetches).
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=10,
+    max_connections=10,
+    keepalive_expiry=30.0,
+)
+
 
 class SseApiError(Exception):
     """SSE API error."""
@@ -35,19 +74,30 @@ class SseCommonQueryClient:
         self.config = config
         self._client: httpx.Client | None = None
         self._last_request_time: float = 0.0
+        # Monotonic timestamp of the next allowed request (token-bucket slot)
+        self._next_slot: float = 0.0
+        self._base_params: dict[str, Any] | None = None
+        # Randomly-seeded counter for JSONP callback nonces; SSE only
+        # echoes the name back, so uniqueness per request is all we need.
+        self._callback_counter: int = random.getrandbits(24)
+
+    def _build_headers(self) -> dict[str, str]:
+        """Build request headers including the Cookie header if configured."""
+        headers = dict(self.config.headers)
+        cookie_header = self.config.build_cookie_header()
+        if cookie_header:
+            headers["Cookie"] = cookie_header
+        return headers
 
     def _get_client(self) -> httpx.Client:
         """Get or create HTTP client."""
         if self._client is None:
-            headers = dict(self.config.headers)
-            cookie_header = self.config.build_cookie_header()
-            if cookie_header:
-                headers["Cookie"] = cookie_header
-
             self._client = httpx.Client(
                 timeout=self.config.timeout,
-                headers=headers,
+                headers=self._build_headers(),
                 follow_redirects=True,
+                http2=True,
+                limits=_POOL_LIMITS,
             )
         return self._client
 
@@ -64,15 +114,18 @@ class SseCommonQueryClient:
         self.close()
 
     def _generate_callback_name(self) -> str:
-        """Generate a random JSONP callback name."""
-        rand_num = random.randint(10000000, 99999999)
-        return f"{self.config.jsonp.callback_prefix}{rand_num}"
+        """Generate a unique JSONP callback name."""
+        self._callback_counter += 1
+        return f"{self.config.jsonp.callback_prefix}{self._callback_counter}"
+
+    def _parse_jsonp(self, payload: bytes, callback_name: str) -> dict[str, Any]:
+        """Parse JSONP response bytes and extract JSON payload.
 
-    def _parse_jsonp(self, text: str, callback_name: str) -> dict[str, Any]:
-        """Parse JSONP response and extract JSON payload.
+        Operating on bytes skips httpx's charset detection and str decode
+        of the whole body; orjson consumes the sliced bytes directly.
 
         Args:
-            text: Raw JSONP response text
+            payload: Raw JSONP response body
             callback_name: Expected callback function name
 
         Returns:
@@ -81,45 +134,47 @@ class SseCommonQueryClient:
         Raises:
             SseApiError: If parsing fails or response indicates error
         """
-        text = text.strip()
-
-        # Check for common error responses
-        if "System Error" in text or "系统繁忙" in text:
-            raise SseApiError("SSE API returned System Error", text[:500])
-
-        if text.startswith("<!") or text.startswith("<html"):
-            raise SseApiError("SSE API returned HTML error page", text[:500])
-
-        # Try to extract JSON from JSONP wrapper
-        # Pattern: callbackName({...}) or callbackName({...});
-        pattern = rf"^{re.escape(callback_name)}\s*\(\s*(.*)\s*\);?\s*$"
-        match = re.match(pattern, text, re.DOTALL)
-
-        if not match:
-            # Try more lenient pattern (any callback name)
-            lenient_pattern = r"^\w+\s*\(\s*(.*)\s*\);?\s*$"
-            match = re.match(lenient_pattern, text, re.DOTALL)
-
-        if not match:
-            raise SseApiError(f"Failed to parse JSONP response", text[:500])
-
-        json_str = match.group(1)
+        payload = payload.strip()
+
+        # Check for common error responses before any JSON work
+        _reject_error_payload(payload)
+
+        # Strip the callbackName({...}); wrapper by offset instead of regex:
+        # slice between the first '(' and the last ')'. This is a single
+        # linear scan versus a DOTALL regex over the whole payload.
+        lparen = payload.find(b"(")
+        rparen = payload.rfind(b")")
+        if lparen >= 0 and rparen > lparen and payload[:lparen].strip() == callback_name.encode():
+            json_bytes = payload[lparen + 1 : rparen].strip()
+        else:
+            # Lenient fallback: any callback name (precompiled pattern)
+            match = _LENIENT_JSONP_RE.match(payload)
+            if not match:
+                raise SseApiError("Failed to parse JSONP response", _snippet(payload))
+            json_bytes = match.group(1)
 
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            raise SseApiError(f"Failed to parse JSON: {e}", json_str[:500]) from e
+            return orjson.loads(json_bytes)
+        except orjson.JSONDecodeError as e:
+            raise SseApiError(f"Failed to parse JSON: {e}", _snippet(json_bytes)) from e
 
     def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        if self.config.rate_limit.requests_per_second <= 0:
+        """Apply rate limiting between requests.
+
+        Token-bucket slot scheduling on the monotonic clock: each request
+        reserves the next slot, immune to wall-clock (NTP) jumps and free
+        of drift from scheduling latency between requests.
+        """
+        rps = self.config.rate_limit.requests_per_second
+        if rps <= 0:
             return
 
-        min_interval = 1.0 / self.config.rate_limit.requests_per_second
-        elapsed = time.time() - self._last_request_time
+        now = time.monotonic()
+        wait = self._next_slot - now
+        self._next_slot = max(self._next_slot, now) + 1.0 / rps
 
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
+        if wait > 0:
+            time.sleep(wait)
 
     def _make_request(self, params: dict[str, Any]) -> httpx.Response:
         """Make HTTP request with retry logic."""
@@ -136,13 +191,40 @@ class SseCommonQueryClient:
         )
         def _do_request() -> httpx.Response:
             self._rate_limit()
-            self._last_request_time = time.time()
+            self._last_request_time = time.monotonic()
             response = client.get(self.config.endpoint, params=params)
             response.raise_for_status()
             return response
 
         return _do_request()
 
+    def _build_page_params(self, page_no: int) -> tuple[dict[str, Any], str]:
+        """Build query parameters for a page request.
+
+        Returns:
+            Tuple of (params dict, callback name)
+        """
+        # Fixed query/filter/page-size params are immutable during a fetch;
+        # build the template once and only fill per-page keys per request.
+        if self._base_params is None:
+            self._base_params = {
+                **self.config.query,
+                **self.config.filters,
+                "pageHelp.pageSize": self.config.pagination.page_size,
+                "pageHelp.cacheSize": self.config.pagination.cache_size,
+            }
+
+        callback_name = self._generate_callback_name()
+
+        params = self._base_params.copy()
+        params[self.config.jsonp.param_name] = callback_name
+        params["_"] = int(time.time() * 1000)
+        params["pageHelp.pageNo"] = page_no
+        params["pageHelp.beginPage"] = page_no
+        params["pageHelp.endPage"] = page_no
+
+        return params, callback_name
+
     def query_page(self, page_no: int) -> dict[str, Any]:
         """Query a single page of stock data.
 
@@ -152,32 +234,10 @@ class SseCommonQueryClient:
         Returns:
             Parsed JSON response containing pageHelp.data and metadata
         """
-        callback_name = self._generate_callback_name()
-        timestamp = int(time.time() * 1000)
-
-        # Build query parameters
-        params: dict[str, Any] = {
-            self.config.jsonp.param_name: callback_name,
-            "_": timestamp,
-        }
-
-        # Add fixed query params
-        params.update(self.config.query)
-
-        # Add filter params
-        params.update(self.config.filters)
-
-        # Add pagination params
-        params.update({
-            "pageHelp.pageNo": page_no,
-            "pageHelp.pageSize": self.config.pagination.page_size,
-            "pageHelp.beginPage": page_no,
-            "pageHelp.endPage": page_no,
-            "pageHelp.cacheSize": self.config.pagination.cache_size,
-        })
+        params, callback_name = self._build_page_params(page_no)
 
         response = self._make_request(params)
-        data = self._parse_jsonp(response.text, callback_name)
+        data = self._parse_jsonp(response.content, callback_name)
 
         # Validate response structure
         if "pageHelp" not in data:
@@ -195,6 +255,11 @@ class SseCommonQueryClient:
             Tuple of (records list, page_help metadata dict)
         """
         response = self.query_page(page_no)
+        return self._extract_page(response)
+
+    @staticmethod
+    def _extract_page(response: dict[str, Any]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Extract records and pagination metadata from a parsed response."""
         page_help = response.get("pageHelp", {})
         records = page_help.get("data", [])
 
@@ -202,3 +267,97 @@ class SseCommonQueryClient:
             records = []
 
         return records, page_help
+
+
+class SseAsyncCommonQueryClient(SseCommonQueryClient):
+    """Async variant of the commonQuery.do client for concurrent fetching.
+
+    Shares JSONP parsing and parameter building with the sync client;
+    requests go through httpx.AsyncClient and rate-limit waits use
+    asyncio.sleep so other in-flight pages are not blocked.
+    """
+
+    def __init__(self, config: SseConfig):
+        super().__init__(config)
+        self._async_client: httpx.AsyncClient | None = None
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get or create async HTTP client."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                headers=self._build_headers(),
+                follow_redirects=True,
+                http2=True,
+                limits=_POOL_LIMITS,
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def __aenter__(self) -> "SseAsyncCommonQueryClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def _arate_limit(self) -> None:
+        """Apply rate limiting without blocking the event loop.
+
+        The slot is reserved before awaiting so concurrent page tasks
+        each claim a distinct slot from the shared bucket.
+        """
+        rps = self.config.rate_limit.requests_per_second
+        if rps <= 0:
+            return
+
+        now = time.monotonic()
+        wait = self._next_slot - now
+        self._next_slot = max(self._next_slot, now) + 1.0 / rps
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _amake_request(self, params: dict[str, Any]) -> httpx.Response:
+        """Make async HTTP request with retry logic."""
+        client = self._get_async_client()
+
+        @retry(
+            retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
+            stop=stop_after_attempt(self.config.retry.max_attempts),
+            wait=wait_exponential(
+                multiplier=self.config.retry.backoff_multiplier,
+                min=self.config.retry.initial_delay,
+            ),
+            reraise=True,
+        )
+        async def _do_request() -> httpx.Response:
+            await self._arate_limit()
+            self._last_request_time = time.monotonic()
+            response = await client.get(self.config.endpoint, params=params)
+            response.raise_for_status()
+            return response
+
+        return await _do_request()
+
+    async def aquery_page(self, page_no: int) -> dict[str, Any]:
+        """Query a single page of stock data (async)."""
+        params, callback_name = self._build_page_params(page_no)
+
+        response = await self._amake_request(params)
+        data = self._parse_jsonp(response.content, callback_name)
+
+        # Validate response structure
+        if "pageHelp" not in data:
+            raise SseApiError("Response missing 'pageHelp' field", str(data)[:500])
+
+        return data
+
+    async def aget_page_data(self, page_no: int) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Get stock records and pagination info for a page (async)."""
+        response = await self.aquery_page(page_no)
+        return self._extract_page(response)
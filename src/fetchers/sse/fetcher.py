@@ -1,20 +1,54 @@
 """SSE stock list fetcher with pagination."""
 
+import asyncio
 import logging
 import time
-from collections.abc import Iterator
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
 from src.models.config import SseConfig
-from src.models.stock import RawSseRecord
 
-from .client import SseCommonQueryClient, SseApiError
+from .client import SseAsyncCommonQueryClient, SseCommonQueryClient, SseApiError
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum errors to sample into progress stats / the manifest
+MAX_ERROR_SAMPLES = 10
+
+# Symbol fields in priority order: A-share code > B-share code > company code
+_SYMBOL_KEYS = ("A_STOCK_CODE", "B_STOCK_CODE", "COMPANY_CODE")
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSseConfig:
+    """Flat, immutable snapshot of the config fields read in the fetch loop.
+
+    Slotted attribute access skips the pydantic model and nested dict
+    lookups that would otherwise run several times per page.
+    """
+
+    endpoint: str
+    sql_id: str | None
+    stock_type: str
+    page_size: int
+    requests_per_second: float
+    page_delay: float
+
+    @classmethod
+    def from_config(cls, config: SseConfig) -> "FrozenSseConfig":
+        return cls(
+            endpoint=config.endpoint,
+            sql_id=config.query.get("sqlId"),
+            stock_type=config.filters.get("STOCK_TYPE", "1"),
+            page_size=config.pagination.page_size,
+            requests_per_second=config.rate_limit.requests_per_second,
+            page_delay=config.rate_limit.page_delay,
+        )
+
 
 @dataclass
 class FetchProgress:
@@ -22,10 +56,17 @@ class FetchProgress:
 
     page_no: int = 0
     total_records: int = 0
-    unique_symbols: set[str] = field(default_factory=set)
+    # Symbols are stored as ints when numeric (the common case for SSE
+    # 6-digit codes): small ints hash trivially and cost far less memory
+    # than the equivalent str objects in a large universe.
+    unique_symbols: set[int | str] = field(default_factory=set)
     failed_pages: int = 0
     retry_count: int = 0
-    errors: list[dict[str, Any]] = field(default_factory=list)
+    skipped_existing: int = 0
+    # Bounded: old samples are discarded automatically past the cap
+    errors: deque[dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=MAX_ERROR_SAMPLES)
+    )
     start_time: float = field(default_factory=time.time)
 
     @property
@@ -48,11 +89,23 @@ class SseFetcher:
     # Maximum pages to fetch (safety limit)
     MAX_PAGES = 500
     # Maximum errors to record in manifest
-    MAX_ERROR_SAMPLES = 10
+    MAX_ERROR_SAMPLES = MAX_ERROR_SAMPLES
+
+    client: SseCommonQueryClient
 
-    def __init__(self, config: SseConfig):
+    def __init__(
+        self,
+        config: SseConfig,
+        prev_snapshot_symbols: set[str] | None = None,
+    ):
         self.config = config
         self.client = SseCommonQueryClient(config)
+        self._cfg = FrozenSseConfig.from_config(config)
+        # Symbols from the previous snapshot; records matching them are
+        # skipped so an incremental fetch only emits new listings.
+        self._prev_symbols = prev_snapshot_symbols or None
+        # Progress of the most recent iteration, for manifest stats
+        self.last_progress: FetchProgress | None = None
 
     def close(self) -> None:
         """Close resources."""
@@ -80,7 +133,7 @@ class SseFetcher:
         4. Too many consecutive empty/error pages
         5. Safety limit reached
         """
-        page_size = self.config.pagination.page_size
+        page_size = self._cfg.page_size
 
         # Check for total pages in response
         total_pages = page_help.get("totalPages") or page_help.get("totalPage")
@@ -126,47 +179,90 @@ class SseFetcher:
 
     def _get_symbol(self, record: dict[str, Any]) -> str | None:
         """Extract stock symbol from record."""
-        # Priority: A_STOCK_CODE > B_STOCK_CODE > COMPANY_CODE
-        symbol = record.get("A_STOCK_CODE")
-        if symbol and symbol != "-":
-            return symbol
+        for key in _SYMBOL_KEYS:
+            symbol: str | None = record.get(key)
+            if symbol and symbol != "-":
+                return symbol
+
+        return None
+
+    def _process_page(
+        self,
+        records: list[dict[str, Any]],
+        progress: FetchProgress,
+    ) -> Iterator[dict[str, Any]]:
+        """Deduplicate and yield raw record dicts from one page.
+
+        Records stay plain dicts on the ingest path: the normalizer reads
+        a fixed subset of keys, so per-row RawSseRecord validation would
+        be pure overhead. The model remains as schema documentation.
+        Callers attach (source_url, asof) at whatever granularity they
+        yield (per record or per page batch).
+        """
+        for raw_data in records:
+            symbol = self._get_symbol(raw_data)
+            if symbol is None:
+                logger.warning(f"Record without symbol: {raw_data}")
+                continue
 
-        symbol = record.get("B_STOCK_CODE")
-        if symbol and symbol != "-":
-            return symbol
+            # Deduplication (numeric codes dedup on their int value)
+            key: int | str = int(symbol) if symbol.isdigit() else symbol
+            if key in progress.unique_symbols:
+                logger.debug(f"Duplicate symbol: {symbol}")
+                continue
 
-        symbol = record.get("COMPANY_CODE")
-        if symbol and symbol != "-":
-            return symbol
+            progress.unique_symbols.add(key)
+            progress.total_records += 1
 
-        return None
+            # Incremental mode: skip symbols already in the prior snapshot
+            if self._prev_symbols is not None and symbol in self._prev_symbols:
+                progress.skipped_existing += 1
+                continue
+
+            yield raw_data
 
     def _build_source_url(self, page_no: int) -> str:
         """Build source URL for tracking."""
-        stock_type = self.config.filters.get("STOCK_TYPE", "1")
         return (
-            f"{self.config.endpoint}?sqlId={self.config.query.get('sqlId')}"
-            f"&STOCK_TYPE={stock_type}&pageNo={page_no}"
+            f"{self._cfg.endpoint}?sqlId={self._cfg.sql_id}"
+            f"&STOCK_TYPE={self._cfg.stock_type}&pageNo={page_no}"
         )
 
     def iter_raw_records(
         self,
         asof: datetime | None = None,
-    ) -> Iterator[tuple[RawSseRecord, str, datetime]]:
+    ) -> Iterator[tuple[dict[str, Any], str, datetime]]:
         """Iterate over all stock records with pagination.
 
         Yields:
             Tuple of (raw_record, source_url, asof_timestamp)
         """
+        for batch, source_url, batch_asof in self.iter_raw_pages(asof):
+            for raw_record in batch:
+                yield raw_record, source_url, batch_asof
+
+    def iter_raw_pages(
+        self,
+        asof: datetime | None = None,
+    ) -> Iterator[tuple[list[dict[str, Any]], str, datetime]]:
+        """Iterate over validated stock records one page at a time.
+
+        Batching a whole page lets callers normalize and write records
+        in bulk instead of paying per-record overhead.
+
+        Yields:
+            Tuple of (records batch, source_url, asof_timestamp)
+        """
         if asof is None:
             asof = datetime.now(timezone.utc)
 
         progress = FetchProgress()
+        self.last_progress = progress
         consecutive_empty = 0
 
         logger.info(
-            f"Starting SSE fetch: STOCK_TYPE={self.config.filters.get('STOCK_TYPE')}, "
-            f"page_size={self.config.pagination.page_size}"
+            f"Starting SSE fetch: STOCK_TYPE={self._cfg.stock_type}, "
+            f"page_size={self._cfg.page_size}"
         )
 
         try:
@@ -184,53 +280,29 @@ class SseFetcher:
                     )
 
                     # Process records
-                    for raw_data in records:
-                        symbol = self._get_symbol(raw_data)
-                        if symbol is None:
-                            logger.warning(f"Record without symbol: {raw_data}")
-                            continue
-
-                        # Deduplication
-                        if symbol in progress.unique_symbols:
-                            logger.debug(f"Duplicate symbol: {symbol}")
-                            continue
-
-                        progress.unique_symbols.add(symbol)
-                        progress.total_records += 1
-
-                        try:
-                            raw_record = RawSseRecord.model_validate(raw_data)
-                            yield raw_record, source_url, asof
-                        except Exception as e:
-                            logger.warning(f"Failed to parse record {symbol}: {e}")
-                            if len(progress.errors) < self.MAX_ERROR_SAMPLES:
-                                progress.errors.append({
-                                    "type": "parse_error",
-                                    "symbol": symbol,
-                                    "error": str(e),
-                                    "page": progress.page_no,
-                                })
+                    batch = list(self._process_page(records, progress))
+                    if batch:
+                        yield batch, source_url, asof
 
                     # Check stop condition
                     if self._should_stop(records, page_help, progress, consecutive_empty):
                         break
 
                     # Page delay
-                    if self.config.rate_limit.page_delay > 0:
-                        time.sleep(self.config.rate_limit.page_delay)
+                    if self._cfg.page_delay > 0:
+                        time.sleep(self._cfg.page_delay)
 
                 except SseApiError as e:
                     consecutive_empty += 1
                     progress.failed_pages += 1
                     logger.error(f"Page {progress.page_no} failed: {e}")
 
-                    if len(progress.errors) < self.MAX_ERROR_SAMPLES:
-                        progress.errors.append({
-                            "type": "api_error",
-                            "page": progress.page_no,
-                            "error": str(e),
-                            "response_snippet": e.response_text[:200] if e.response_text else None,
-                        })
+                    progress.errors.append({
+                        "type": "api_error",
+                        "page": progress.page_no,
+                        "error": str(e),
+                        "response_snippet": e.response_text[:200] if e.response_text else None,
+                    })
 
                     if consecutive_empty >= self.MAX_CONSECUTIVE_FAILURES:
                         logger.error("Too many consecutive failures, stopping")
@@ -241,12 +313,11 @@ class SseFetcher:
                     progress.failed_pages += 1
                     logger.exception(f"Unexpected error on page {progress.page_no}: {e}")
 
-                    if len(progress.errors) < self.MAX_ERROR_SAMPLES:
-                        progress.errors.append({
-                            "type": "unexpected_error",
-                            "page": progress.page_no,
-                            "error": str(e),
-                        })
+                    progress.errors.append({
+                        "type": "unexpected_error",
+                        "page": progress.page_no,
+                        "error": str(e),
+                    })
 
                     if consecutive_empty >= self.MAX_CONSECUTIVE_FAILURES:
                         break
@@ -267,6 +338,199 @@ class SseFetcher:
             "unique_records": progress.unique_count,
             "failed_pages": progress.failed_pages,
             "retry_count": progress.retry_count,
+            "skipped_existing": progress.skipped_existing,
             "duration_seconds": progress.duration,
-            "errors": progress.errors,
+            "errors": list(progress.errors),
+        }
+
+
+class SseAsyncFetcher(SseFetcher):
+    """Concurrent SSE fetcher built on httpx.AsyncClient.
+
+    Page 1 reveals the total page count; the remaining pages are then
+    requested concurrently (bounded by a semaphore derived from the rate
+    limit) and yielded in page order, so network wait overlaps parsing.
+    Falls back to sequential paging when the response reports no total.
+    """
+
+    client: SseAsyncCommonQueryClient
+
+    def __init__(
+        self,
+        config: SseConfig,
+        prev_snapshot_symbols: set[str] | None = None,
+    ):
+        self.config = config
+        self.client = SseAsyncCommonQueryClient(config)
+        self._cfg = FrozenSseConfig.from_config(config)
+        self._prev_symbols = prev_snapshot_symbols or None
+        self.last_progress: FetchProgress | None = None
+
+    async def aclose(self) -> None:
+        """Close resources."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "SseAsyncFetcher":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    # The inherited sync surface would silently open (and leak) a second
+    # HTTP client next to the AsyncClient; fail fast instead.
+
+    def __enter__(self) -> "SseAsyncFetcher":
+        raise TypeError("SseAsyncFetcher is asynchronous; use 'async with' instead of 'with'")
+
+    def close(self) -> None:
+        raise TypeError("SseAsyncFetcher is asynchronous; use aclose() instead of close()")
+
+    def iter_raw_pages(
+        self,
+        asof: datetime | None = None,
+    ) -> Iterator[tuple[list[dict[str, Any]], str, datetime]]:
+        raise TypeError(
+            "SseAsyncFetcher has no sync page iteration; "
+            "use iter_raw_records() (async) or fetch_raw_records()"
+        )
+
+    def _total_pages(self, page_help: dict[str, Any]) -> int | None:
+        """Extract the total page count from page metadata, if reported."""
+        total_pages = page_help.get("totalPages") or page_help.get("totalPage")
+        if total_pages is not None:
+            try:
+                return min(int(total_pages), self.MAX_PAGES)
+            except (ValueError, TypeError):
+                pass
+
+        total = page_help.get("total")
+        if total is not None:
+            try:
+                page_size = self._cfg.page_size
+                return min(-(-int(total) // page_size), self.MAX_PAGES)
+            except (ValueError, TypeError, ZeroDivisionError):
+                pass
+
+        return None
+
+    def _record_page_error(self, progress: FetchProgress, page_no: int, e: Exception) -> None:
+        """Record a failed page in progress stats."""
+        progress.failed_pages += 1
+        logger.error(f"Page {page_no} failed: {e}")
+
+        error: dict[str, Any] = {
+            "type": "api_error" if isinstance(e, SseApiError) else "unexpected_error",
+            "page": page_no,
+            "error": str(e),
         }
+        if isinstance(e, SseApiError) and e.response_text:
+            error["response_snippet"] = e.response_text[:200]
+        progress.errors.append(error)
+
+    async def iter_raw_records(  # type: ignore[override]
+        self,
+        asof: datetime | None = None,
+    ) -> AsyncIterator[tuple[dict[str, Any], str, datetime]]:
+        """Iterate over all stock records, fetching pages concurrently.
+
+        Yields:
+            Tuple of (raw_record, source_url, asof_timestamp)
+        """
+        if asof is None:
+            asof = datetime.now(timezone.utc)
+
+        progress = FetchProgress()
+        self.last_progress = progress
+        tasks: list[asyncio.Task[tuple[list[dict[str, Any]], dict[str, Any]]]] = []
+
+        logger.info(
+            f"Starting SSE async fetch: STOCK_TYPE={self._cfg.stock_type}, "
+            f"page_size={self._cfg.page_size}"
+        )
+
+        try:
+            progress.page_no = 1
+            records, page_help = await self.client.aget_page_data(1)
+
+            source_url = self._build_source_url(1)
+            for raw in self._process_page(records, progress):
+                yield raw, source_url, asof
+
+            total_pages = self._total_pages(page_help)
+
+            if total_pages is None:
+                # Total unknown: fall back to sequential paging with the
+                # same stop conditions as the sync fetcher.
+                consecutive_empty = 0
+                while not self._should_stop(records, page_help, progress, consecutive_empty):
+                    progress.page_no += 1
+                    try:
+                        records, page_help = await self.client.aget_page_data(progress.page_no)
+                        consecutive_empty = 0
+                    except Exception as e:
+                        consecutive_empty += 1
+                        self._record_page_error(progress, progress.page_no, e)
+                        if consecutive_empty >= self.MAX_CONSECUTIVE_FAILURES:
+                            logger.error("Too many consecutive failures, stopping")
+                            break
+                        continue
+
+                    source_url = self._build_source_url(progress.page_no)
+                    for raw in self._process_page(records, progress):
+                        yield raw, source_url, asof
+                return
+
+            # Total known: fetch remaining pages concurrently, bounded by
+            # the rate limit, and consume results in page order.
+            semaphore = asyncio.Semaphore(
+                max(1, int(self._cfg.requests_per_second))
+            )
+
+            async def fetch_page(
+                page_no: int,
+            ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+                async with semaphore:
+                    return await self.client.aget_page_data(page_no)
+
+            page_range = range(2, total_pages + 1)
+            tasks = [asyncio.create_task(fetch_page(p)) for p in page_range]
+
+            for page_no, task in zip(page_range, tasks, strict=True):
+                progress.page_no = page_no
+                try:
+                    records, _ = await task
+                except Exception as e:
+                    self._record_page_error(progress, page_no, e)
+                    continue
+
+                source_url = self._build_source_url(page_no)
+                for raw in self._process_page(records, progress):
+                    yield raw, source_url, asof
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            logger.info(
+                f"Fetch completed: {progress.page_no} pages, "
+                f"{progress.unique_count} unique records, "
+                f"{progress.failed_pages} failed pages, "
+                f"{progress.duration:.1f}s"
+            )
+
+    def fetch_raw_records(
+        self,
+        asof: datetime | None = None,
+    ) -> list[tuple[dict[str, Any], str, datetime]]:
+        """Run the async pipeline to completion from sync code.
+
+        Thin asyncio.run wrapper for callers that are not async-aware.
+        """
+
+        async def _collect() -> list[tuple[dict[str, Any], str, datetime]]:
+            try:
+                return [item async for item in self.iter_raw_records(asof)]
+            finally:
+                await self.aclose()
+
+        return asyncio.run(_collect())
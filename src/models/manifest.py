@@ -14,6 +14,10 @@ class FetchStats(BaseModel):
     unique_records: int = Field(description="Unique records after dedup")
     failed_pages: int = Field(default=0, description="Number of failed page requests")
     retry_count: int = Field(default=0, description="Total retry attempts")
+    skipped_existing: int = Field(
+        default=0,
+        description="Records skipped because their symbol exists in the base snapshot"
+    )
     duration_seconds: float = Field(description="Total fetch duration")
     
     categories: dict[str, int] = Field(
@@ -32,6 +36,17 @@ class UniverseManifest(BaseModel):
     exchange: str = Field(description="Exchange identifier")
     asof: datetime = Field(description="Snapshot timestamp (ISO 8601)")
     version: str = Field(default="1.0", description="Manifest schema version")
+
+    # Delta snapshots (--incremental) contain only symbols absent from
+    # their base; consumers must union back to the last full snapshot.
+    incremental: bool = Field(
+        default=False,
+        description="True if this snapshot is a delta against base_snapshot"
+    )
+    base_snapshot: str | None = Field(
+        default=None,
+        description="Snapshot directory name this delta was fetched against"
+    )
     
     # Source information
     endpoint: str = Field(description="API endpoint URL")
@@ -55,7 +70,7 @@ class UniverseManifest(BaseModel):
     # Error information (if any)
     errors: list[dict[str, Any]] = Field(
         default_factory=list,
-        description="Error samples (first N errors)"
+        description="Error samples (most recent N errors)"
     )
     
     # Output files
@@ -65,9 +80,16 @@ class UniverseManifest(BaseModel):
     )
 
     def to_safe_dict(self) -> dict[str, Any]:
-        """Convert to dict, ensuring no sensitive data is included."""
-        data = self.model_dump(mode="json")
-        # Explicitly remove any accidentally included sensitive fields
-        if "cookies" in data:
-            del data["cookies"]
+        """Convert to dict, ensuring no sensitive data is included.
+
+        Built from the declared field whitelist rather than
+        model_dump(mode="json"): anything not declared above (e.g. a
+        stray cookies attribute) can never leak, and orjson serializes
+        the asof datetime natively so no JSON-mode coercion pass is
+        needed.
+        """
+        data = {name: getattr(self, name) for name in type(self).model_fields}
+        data["stats"] = {
+            name: getattr(self.stats, name) for name in FetchStats.model_fields
+        }
         return data
@@ -1,5 +1,6 @@
 """Stock record models."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Literal
 
@@ -9,37 +10,47 @@ from pydantic import BaseModel, Field
 ExchangeName = Literal["Shanghai_Stocks", "Shenzen_Stocks", "Beijing_Stocks"]
 
 
-class StockRecord(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class StockRecord:
     """Normalized stock record for universe storage.
 
-    This is the unified schema across all exchanges.
+    This is the unified schema across all exchanges. A slotted dataclass
+    rather than a pydantic model: records are built by our own
+    normalizers from already-validated input, so per-field validation
+    would only add per-record cost and memory on the write path.
+
+    The storage layer serializes records field-by-field with orjson, so
+    no model machinery is needed on the write path either.
     """
 
-    exchange: ExchangeName = Field(description="Exchange identifier")
-    symbol: str = Field(description="Stock code (e.g., '600105')")
-    name: str = Field(description="Stock short name (e.g., '永鼎股份')")
-    full_name: str | None = Field(default=None, description="Full company name")
-    category: str = Field(description="Stock category/type from exchange (e.g., 'STOCK_TYPE_1')")
-    
+    exchange: ExchangeName  # Exchange identifier
+    symbol: str  # Stock code (e.g., '600105')
+    name: str  # Stock short name (e.g., '永鼎股份')
+    full_name: str | None = None  # Full company name
+    category: str  # Stock category/type from exchange (e.g., 'STOCK_TYPE_1')
+
     # Additional metadata
-    list_date: str | None = Field(default=None, description="Listing date (YYYYMMDD)")
-    csrc_code: str | None = Field(default=None, description="CSRC industry code")
-    csrc_desc: str | None = Field(default=None, description="CSRC industry description")
-    province: str | None = Field(default=None, description="Registration province")
-    status: str | None = Field(default=None, description="Company/stock status code")
-    
+    list_date: str | None = None  # Listing date (YYYYMMDD)
+    csrc_code: str | None = None  # CSRC industry code
+    csrc_desc: str | None = None  # CSRC industry description
+    province: str | None = None  # Registration province
+    status: str | None = None  # Company/stock status code
+
     # Source tracking
-    source_url: str = Field(description="Source URL or request identifier")
-    asof: datetime = Field(description="Snapshot timestamp")
-    
+    source_url: str  # Source URL or request identifier
+    asof: datetime  # Snapshot timestamp
+
     # Optional: preserve raw data for debugging
-    raw: dict | None = Field(default=None, description="Original record from exchange")
+    raw: dict | None = None  # Original record from exchange
 
 
 class RawSseRecord(BaseModel):
     """Raw record from SSE commonQuery.do API.
 
-    Field names match SSE API response exactly.
+    Field names match SSE API response exactly. Kept as the documented
+    schema of the SSE payload (and for ad-hoc validation); the fetch
+    pipeline itself passes raw records through as plain dicts, since the
+    normalizer only reads a fixed subset of fields.
     """
 
     A_STOCK_CODE: str | None = Field(default=None)
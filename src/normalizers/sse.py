@@ -1,8 +1,9 @@
 """SSE record normalization to unified StockRecord schema."""
 
 from datetime import datetime
+from typing import Any
 
-from src.models.stock import RawSseRecord, StockRecord
+from src.models.stock import StockRecord
 
 
 # Mapping of STOCK_TYPE values to category names
@@ -12,9 +13,26 @@ STOCK_TYPE_MAP = {
     "8": "科创板",
 }
 
+# Full category strings, prebuilt so normalization does one dict lookup
+# per record instead of re-formatting the same few strings
+_CATEGORY_BY_STOCK_TYPE = {k: f"STOCK_TYPE_{k}_{v}" for k, v in STOCK_TYPE_MAP.items()}
+
+
+def category_for_stock_type(stock_type: str) -> str:
+    """Category name for a STOCK_TYPE filter value."""
+    return _CATEGORY_BY_STOCK_TYPE.get(stock_type) or f"STOCK_TYPE_{stock_type}"
+
+
+def _pick(*values: str | None) -> str | None:
+    """Return the first value that is set and not the '-' placeholder."""
+    for v in values:
+        if v and v != "-":
+            return v
+    return None
+
 
 def normalize_sse_record(
-    raw: RawSseRecord,
+    raw: dict[str, Any],
     source_url: str,
     asof: datetime,
     *,
@@ -23,8 +41,12 @@ def normalize_sse_record(
 ) -> StockRecord:
     """Normalize SSE raw record to unified StockRecord.
 
+    The raw record is the plain dict parsed from the SSE response (see
+    RawSseRecord in models/stock.py for the documented schema); only the
+    fields mapped below are read.
+
     Args:
-        raw: Raw record from SSE API
+        raw: Raw record dict from SSE API
         source_url: Source URL for tracking
         asof: Snapshot timestamp
         stock_type: STOCK_TYPE filter value used in request
@@ -33,31 +55,21 @@ def normalize_sse_record(
     Returns:
         Normalized StockRecord
     """
+    get = raw.get
+
     # Extract symbol (priority: A_STOCK_CODE > B_STOCK_CODE > COMPANY_CODE)
-    symbol = raw.A_STOCK_CODE
-    if not symbol or symbol == "-":
-        symbol = raw.B_STOCK_CODE
-    if not symbol or symbol == "-":
-        symbol = raw.COMPANY_CODE
-    if not symbol or symbol == "-":
+    symbol = _pick(get("A_STOCK_CODE"), get("B_STOCK_CODE"), get("COMPANY_CODE"))
+    if symbol is None:
         raise ValueError(f"Cannot extract symbol from record: {raw}")
 
     # Extract name (priority: SEC_NAME_CN > COMPANY_ABBR > SEC_NAME_FULL)
-    name = raw.SEC_NAME_CN
-    if not name:
-        name = raw.COMPANY_ABBR
-    if not name:
-        name = raw.SEC_NAME_FULL
-    if not name:
-        name = symbol  # Fallback to symbol
+    name = _pick(get("SEC_NAME_CN"), get("COMPANY_ABBR"), get("SEC_NAME_FULL")) or symbol
 
     # Full name
-    full_name = raw.FULL_NAME or raw.SEC_NAME_FULL
+    full_name = get("FULL_NAME") or get("SEC_NAME_FULL")
 
     # Category: combine STOCK_TYPE for grouping
-    category = f"STOCK_TYPE_{stock_type}"
-    if stock_type in STOCK_TYPE_MAP:
-        category = f"{category}_{STOCK_TYPE_MAP[stock_type]}"
+    category = category_for_stock_type(stock_type)
 
     # Build normalized record
     record = StockRecord(
@@ -66,14 +78,14 @@ def normalize_sse_record(
         name=name,
         full_name=full_name,
         category=category,
-        list_date=raw.LIST_DATE,
-        csrc_code=raw.CSRC_CODE,
-        csrc_desc=raw.CSRC_CODE_DESC,
-        province=raw.AREA_NAME_DESC,
-        status=raw.STATE_CODE_STOCK,
+        list_date=get("LIST_DATE"),
+        csrc_code=get("CSRC_CODE"),
+        csrc_desc=get("CSRC_CODE_DESC"),
+        province=get("AREA_NAME_DESC"),
+        status=get("STATE_CODE_STOCK"),
         source_url=source_url,
         asof=asof,
-        raw=raw.model_dump() if include_raw else None,
+        raw=dict(raw) if include_raw else None,
     )
 
     return record
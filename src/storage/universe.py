@@ -14,7 +14,8 @@ Directory structure:
 """
 
 import logging
-from collections import defaultdict
+import os
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -27,13 +28,50 @@ from src.models.stock import StockRecord
 
 logger = logging.getLogger(__name__)
 
+# orjson options for JSONL lines, resolved once
+_JSONL_OPTS = orjson.OPT_APPEND_NEWLINE
+
+# StockRecord fields that are optional and omitted from output when None
+_OPTIONAL_FIELDS = (
+    "full_name",
+    "list_date",
+    "csrc_code",
+    "csrc_desc",
+    "province",
+    "status",
+    "raw",
+)
+
+
+def _record_to_dict(record: StockRecord) -> dict[str, Any]:
+    """Build the JSON dict for a record, omitting unset optional fields.
+
+    One presence-checked pass, so orjson serializes exactly what ends up
+    in the line — no exclude_none filtering pass beforehand. orjson
+    handles the asof datetime natively.
+    """
+    d: dict[str, Any] = {
+        "exchange": record.exchange,
+        "symbol": record.symbol,
+        "name": record.name,
+        "category": record.category,
+        "source_url": record.source_url,
+        "asof": record.asof,
+    }
+    for key in _OPTIONAL_FIELDS:
+        v = getattr(record, key)
+        if v is not None:
+            d[key] = v
+    return d
+
+
+# Problematic filename characters, each mapped to '_'
+_FN_TRANSLATE = str.maketrans(dict.fromkeys('/\\:*?"<>|', "_"))
+
 
 def _safe_filename(s: str) -> str:
     """Convert string to safe filename."""
-    # Replace problematic characters
-    for char in ['/', '\\', ':', '*', '?', '"', '<', '>', '|']:
-        s = s.replace(char, '_')
-    return s
+    return s.translate(_FN_TRANSLATE)
 
 
 def _format_timestamp(dt: datetime) -> str:
@@ -44,17 +82,40 @@ def _format_timestamp(dt: datetime) -> str:
 class SnapshotWriter:
     """Writer for a single universe snapshot.
 
-    Manages file handles and writes records in JSONL format.
+    Manages file handles and writes records in JSONL format. Serialized
+    lines accumulate in a per-category bytearray and are flushed in large
+    chunks, so record writes do not translate into per-record syscalls.
     """
 
-    def __init__(self, snapshot_dir: Path, exchange: str):
+    # Flush a category buffer to its file once it exceeds this many bytes
+    BUFFER_FLUSH_BYTES = 1 << 18
+
+    def __init__(
+        self,
+        snapshot_dir: Path,
+        exchange: str,
+        categories: Iterable[str] | None = None,
+    ):
         self.snapshot_dir = snapshot_dir
         self.exchange = exchange
         self.exchange_dir = snapshot_dir / exchange
 
         self._file_handles: dict[str, Any] = {}
-        self._category_counts: dict[str, int] = defaultdict(int)
+        self._buffers: dict[str, bytearray] = {}
+        # Plain dict with counts seeded on first sight of a category:
+        # defaultdict would run its factory check on every increment.
+        self._category_counts: dict[str, int] = {}
         self._total_count = 0
+        self._unique_count = 0
+        # Compact bytes keys ("exchange|symbol") of records already
+        # written via write_record_deduped
+        self._seen: set[bytes] = set()
+        # Safe file paths, precomputed for categories known up front;
+        # unknown categories still get a path on first write.
+        self._paths: dict[str, Path] = {
+            category: self.exchange_dir / f"class={_safe_filename(category)}.jsonl"
+            for category in (categories or ())
+        }
 
     def __enter__(self) -> "SnapshotWriter":
         self.exchange_dir.mkdir(parents=True, exist_ok=True)
@@ -64,51 +125,145 @@ class SnapshotWriter:
         self.close()
 
     def close(self) -> None:
-        """Close all file handles."""
+        """Flush pending buffers and close all file handles."""
+        for category in self._file_handles:
+            self._flush_buffer(category)
         for fh in self._file_handles.values():
             fh.close()
         self._file_handles.clear()
+        self._buffers.clear()
+
+    def _flush_buffer(self, category: str) -> None:
+        """Write a category's pending buffer to its file."""
+        buf = self._buffers[category]
+        if buf:
+            self._file_handles[category].write(buf)
+            buf.clear()
 
     def _get_file_handle(self, category: str) -> Any:
         """Get or create file handle for category."""
         if category not in self._file_handles:
-            safe_category = _safe_filename(category)
-            filepath = self.exchange_dir / f"class={safe_category}.jsonl"
-            self._file_handles[category] = open(filepath, "wb")
+            filepath = self._paths.get(category)
+            if filepath is None:
+                filepath = self._paths[category] = (
+                    self.exchange_dir / f"class={_safe_filename(category)}.jsonl"
+                )
+            # Unbuffered (raw) handle: the per-category bytearray already
+            # batches lines into large chunks, so a BufferedWriter on top
+            # would only re-copy each flush before the same syscall.
+            self._file_handles[category] = open(filepath, "wb", buffering=0)
+            self._buffers[category] = bytearray()
+            self._category_counts.setdefault(category, 0)
             logger.debug(f"Created file: {filepath}")
         return self._file_handles[category]
 
     def write_record(self, record: StockRecord) -> None:
         """Write a single stock record."""
-        fh = self._get_file_handle(record.category)
+        category = record.category
+        if category not in self._file_handles:
+            self._get_file_handle(category)
 
-        # Serialize to JSON bytes with orjson
-        json_bytes = orjson.dumps(
-            record.model_dump(mode="json", exclude_none=True),
-            option=orjson.OPT_APPEND_NEWLINE,
-        )
-        fh.write(json_bytes)
+        buf = self._buffers[category]
+        buf += orjson.dumps(_record_to_dict(record), option=_JSONL_OPTS)
+        if len(buf) >= self.BUFFER_FLUSH_BYTES:
+            self._flush_buffer(category)
 
-        self._category_counts[record.category] += 1
+        self._category_counts[category] += 1
         self._total_count += 1
+        self._unique_count += 1
+
+    def write_record_deduped(self, record: StockRecord) -> bool:
+        """Write a record unless its (exchange, symbol) was seen before.
+
+        Duplicates still count toward the pre-dedup total, so
+        total_records vs unique_records in the manifest shows how many
+        were dropped.
+
+        Returns:
+            True if the record was written, False if it was a duplicate
+        """
+        key = f"{record.exchange}|{record.symbol}".encode()
+        if key in self._seen:
+            self._total_count += 1
+            return False
+        self._seen.add(key)
+        self.write_record(record)
+        return True
+
+    def write_records(self, records: Iterable[StockRecord]) -> None:
+        """Write a batch of stock records.
+
+        Serialized lines are grouped by category and appended to the
+        category buffer in one go, instead of one write per record.
+        """
+        chunks: dict[str, list[bytes]] = {}
+
+        # Hoist attribute/method lookups out of the per-record loop
+        dumps = orjson.dumps
+        to_dict = _record_to_dict
+        category_counts = self._category_counts
+        count = 0
+
+        for record in records:
+            category = record.category
+            lines = chunks.get(category)
+            if lines is None:
+                lines = chunks[category] = []
+                category_counts.setdefault(category, 0)
+            lines.append(dumps(to_dict(record), option=_JSONL_OPTS))
+            category_counts[category] += 1
+            count += 1
+
+        self._total_count += count
+        self._unique_count += count
+
+        buffers = self._buffers
+        for category, lines in chunks.items():
+            buf = buffers.get(category)
+            if buf is None:
+                self._get_file_handle(category)
+                buf = buffers[category]
+            buf += b"".join(lines)
+            if len(buf) >= self.BUFFER_FLUSH_BYTES:
+                self._flush_buffer(category)
 
     def get_stats(self) -> dict[str, int]:
         """Get category counts."""
         return dict(self._category_counts)
 
     def get_total_count(self) -> int:
-        """Get total records written."""
+        """Get total records offered, including skipped duplicates."""
         return self._total_count
 
+    def get_unique_count(self) -> int:
+        """Get records actually written (after dedup)."""
+        return self._unique_count
+
     def get_output_files(self) -> list[str]:
         """Get list of output file paths relative to snapshot dir."""
         files = []
         for category in self._category_counts:
-            safe_category = _safe_filename(category)
-            files.append(f"{self.exchange}/class={safe_category}.jsonl")
+            files.append(f"{self.exchange}/{self._paths[category].name}")
         return sorted(files)
 
 
+def write_exchange_snapshot(
+    snapshot_dir: Path,
+    exchange: str,
+    records: list[StockRecord],
+    categories: Iterable[str] | None = None,
+) -> dict[str, int]:
+    """Write one exchange's records into a snapshot and return its stats.
+
+    Module-level (picklable) so it can be submitted as one task per
+    exchange to a ProcessPoolExecutor; exchanges never share files, so
+    the workers need no coordination.
+    """
+    with SnapshotWriter(snapshot_dir, exchange, categories=categories) as writer:
+        writer.write_records(records)
+        return writer.get_stats()
+
+
 class UniverseStorage:
     """Storage manager for universe snapshots."""
 
@@ -122,10 +277,97 @@ class UniverseStorage:
         snapshot_dir.mkdir(parents=True, exist_ok=True)
         return snapshot_dir
 
-    def open_writer(self, asof: datetime, exchange: str) -> SnapshotWriter:
-        """Open a snapshot writer for the given exchange."""
+    def open_writer(
+        self,
+        asof: datetime,
+        exchange: str,
+        categories: Iterable[str] | None = None,
+    ) -> SnapshotWriter:
+        """Open a snapshot writer for the given exchange.
+
+        Args:
+            asof: Snapshot timestamp
+            exchange: Exchange directory name
+            categories: Categories expected in this snapshot, if known;
+                lets the writer precompute file paths
+        """
+        snapshot_dir = self.create_snapshot_dir(asof)
+        return SnapshotWriter(snapshot_dir, exchange, categories=categories)
+
+    def open_writers(
+        self,
+        asof: datetime,
+        exchanges: Iterable[str],
+        categories_by_exchange: dict[str, list[str]] | None = None,
+    ) -> dict[str, SnapshotWriter]:
+        """Open one snapshot writer per exchange, keyed by exchange name.
+
+        Exchanges write to disjoint directories, so their writers can run
+        concurrently — e.g. one `write_exchange_snapshot` task per
+        exchange on a ProcessPoolExecutor once multiple exchanges exist
+        (M4). Callers are responsible for closing each writer.
+        """
         snapshot_dir = self.create_snapshot_dir(asof)
-        return SnapshotWriter(snapshot_dir, exchange)
+        categories_by_exchange = categories_by_exchange or {}
+        return {
+            exchange: SnapshotWriter(
+                snapshot_dir,
+                exchange,
+                categories=categories_by_exchange.get(exchange),
+            )
+            for exchange in exchanges
+        }
+
+    def _snapshot_is_incremental(self, snapshot_dir: Path) -> bool:
+        """Whether a snapshot's manifest marks it as a delta."""
+        manifest_path = snapshot_dir / "manifest.json"
+        if not manifest_path.exists():
+            # No manifest: assume full so the delta-chain walk stops here
+            return False
+        try:
+            return bool(orjson.loads(manifest_path.read_bytes()).get("incremental", False))
+        except orjson.JSONDecodeError:
+            return False
+
+    def load_latest_symbols(self, exchange: str) -> tuple[set[str], str] | None:
+        """Load the known symbol universe for incremental fetches.
+
+        Delta snapshots only contain symbols absent from their base, so
+        symbols are unioned newest-first back through consecutive deltas
+        until the last full snapshot (inclusive). A fetcher can then skip
+        records whose symbol is anywhere in that chain.
+
+        Returns:
+            Tuple of (symbols, newest snapshot name), or None if no
+            prior snapshot holds data for this exchange
+        """
+        snapshots = sorted(self.base_dir.glob("snapshot=*"), reverse=True)
+        if not snapshots:
+            return None
+
+        symbols: set[str] = set()
+        found_exchange = False
+        for snapshot_dir in snapshots:
+            exchange_dir = snapshot_dir / exchange
+            if exchange_dir.is_dir():
+                found_exchange = True
+                for jsonl_path in exchange_dir.glob("class=*.jsonl"):
+                    with open(jsonl_path, "rb") as f:
+                        for line in f:
+                            symbol = orjson.loads(line).get("symbol")
+                            if symbol:
+                                symbols.add(symbol)
+            if not self._snapshot_is_incremental(snapshot_dir):
+                break
+
+        if not found_exchange:
+            return None
+
+        logger.info(
+            f"Loaded {len(symbols)} symbols back to the last full snapshot "
+            f"(newest: {snapshots[0].name})"
+        )
+        return symbols, snapshots[0].name
 
     def write_manifest(
         self,
@@ -136,12 +378,26 @@ class UniverseStorage:
         snapshot_dir = self.create_snapshot_dir(asof)
         manifest_path = snapshot_dir / "manifest.json"
 
-        with open(manifest_path, "wb") as f:
-            json_bytes = orjson.dumps(
-                manifest.to_safe_dict(),
-                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
-            )
-            f.write(json_bytes)
+        # Write to a temp file and rename into place, so a crash mid-write
+        # never leaves a truncated manifest.json behind.
+        # No OPT_SORT_KEYS: to_safe_dict emits fields in declaration
+        # order, which is already the order readers expect.
+        json_bytes = orjson.dumps(manifest.to_safe_dict(), option=orjson.OPT_INDENT_2)
+        tmp_path = manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(json_bytes)
+        os.replace(tmp_path, manifest_path)
+
+        # Companion summary with just the display fields, so listing
+        # snapshots never has to decode the full manifest (errors, config).
+        summary = {
+            "exchange": manifest.exchange,
+            "asof": manifest.asof,
+            "unique_records": manifest.stats.unique_records,
+            "duration_seconds": manifest.stats.duration_seconds,
+            "incremental": manifest.incremental,
+        }
+        summary_path = snapshot_dir / "manifest_summary.json"
+        summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Manifest written: {manifest_path}")
         return manifest_path
@@ -155,14 +411,21 @@ class UniverseStorage:
         duration_seconds: float,
         failed_pages: int = 0,
         errors: list[dict[str, Any]] | None = None,
+        skipped_existing: int = 0,
+        base_snapshot: str | None = None,
     ) -> UniverseManifest:
-        """Build manifest from fetch results."""
+        """Build manifest from fetch results.
+
+        A non-None base_snapshot marks the snapshot as a delta against
+        that base (incremental fetch).
+        """
         stats = FetchStats(
             total_pages=0,  # Will be set by caller if needed
             total_records=writer.get_total_count(),
-            unique_records=writer.get_total_count(),
+            unique_records=writer.get_unique_count(),
             failed_pages=failed_pages,
             retry_count=0,
+            skipped_existing=skipped_existing,
             duration_seconds=duration_seconds,
             categories=writer.get_stats(),
         )
@@ -170,6 +433,8 @@ class UniverseStorage:
         manifest = UniverseManifest(
             exchange=exchange,
             asof=asof,
+            incremental=base_snapshot is not None,
+            base_snapshot=base_snapshot,
             endpoint=config.endpoint,
             query_params=config.query,
             filters=config.filters,
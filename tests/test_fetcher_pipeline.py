@@ -0,0 +1,129 @@
+"""End-to-end fetch pipeline tests against a stubbed SSE client.
+
+Exercises the exact consumer loops (CLI page-batch loop and the
+per-record generator contract) without any network I/O, so a change to
+what the fetcher yields breaks here instead of silently producing empty
+snapshots.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import orjson
+
+from src.fetchers.sse import SseAsyncFetcher, SseFetcher
+from src.models.config import SseConfig
+from src.normalizers.sse import category_for_stock_type, normalize_sse_record
+from src.storage.universe import UniverseStorage
+
+
+def _record(code: str, name: str = "测试") -> dict:
+    return {"A_STOCK_CODE": code, "SEC_NAME_CN": name, "STOCK_TYPE": "1"}
+
+
+class StubClient:
+    """Stands in for SseCommonQueryClient: canned pages, no network."""
+
+    def __init__(self, pages: list[list[dict]]):
+        self.pages = pages
+
+    def get_page_data(self, page_no: int) -> tuple[list[dict], dict]:
+        records = self.pages[page_no - 1] if page_no <= len(self.pages) else []
+        return records, {"totalPages": len(self.pages)}
+
+    async def aget_page_data(self, page_no: int) -> tuple[list[dict], dict]:
+        return self.get_page_data(page_no)
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _make_fetcher(pages: list[list[dict]], **kwargs) -> SseFetcher:
+    config = SseConfig(pagination={"page_size": 2}, rate_limit={"page_delay": 0.0})
+    fetcher = SseFetcher(config, **kwargs)
+    fetcher.client = StubClient(pages)
+    return fetcher
+
+
+def _make_async_fetcher(pages: list[list[dict]]) -> SseAsyncFetcher:
+    config = SseConfig(pagination={"page_size": 2}, rate_limit={"page_delay": 0.0})
+    fetcher = SseAsyncFetcher(config)
+    fetcher.client = StubClient(pages)
+    return fetcher
+
+
+PAGES = [
+    [_record("600105"), _record("600106")],
+    [_record("600106"), _record("600107")],  # 600106 duplicated across pages
+]
+
+
+def test_iter_raw_pages_yields_raw_dict_batches():
+    fetcher = _make_fetcher(PAGES)
+    asof = datetime.now(timezone.utc)
+
+    batches = list(fetcher.iter_raw_pages(asof))
+
+    assert len(batches) == 2
+    for batch, source_url, batch_asof in batches:
+        assert batch_asof is asof
+        assert "pageNo=" in source_url
+        for raw in batch:
+            assert isinstance(raw, dict) and "A_STOCK_CODE" in raw
+
+    symbols = [r["A_STOCK_CODE"] for batch, _, _ in batches for r in batch]
+    assert symbols == ["600105", "600106", "600107"]  # deduplicated
+
+
+def test_iter_raw_records_contract():
+    """Each item is (raw_record_dict, source_url, asof) — the documented
+    generator contract new exchanges are told to follow."""
+    fetcher = _make_fetcher(PAGES)
+    asof = datetime.now(timezone.utc)
+
+    items = list(fetcher.iter_raw_records(asof))
+
+    assert [raw["A_STOCK_CODE"] for raw, _, _ in items] == ["600105", "600106", "600107"]
+    for raw, source_url, item_asof in items:
+        assert isinstance(raw, dict)
+        assert isinstance(source_url, str)
+        assert item_asof is asof
+
+
+async def test_async_iter_raw_records_contract():
+    fetcher = _make_async_fetcher(PAGES)
+    asof = datetime.now(timezone.utc)
+
+    items = [item async for item in fetcher.iter_raw_records(asof)]
+
+    assert [raw["A_STOCK_CODE"] for raw, _, _ in items] == ["600105", "600106", "600107"]
+    for raw, _, item_asof in items:
+        assert isinstance(raw, dict)
+        assert item_asof is asof
+
+
+def test_cli_style_fetch_writes_snapshot(tmp_path: Path):
+    """The CLI loop end to end: pages -> normalize -> snapshot on disk."""
+    fetcher = _make_fetcher(PAGES)
+    storage = UniverseStorage(tmp_path)
+    asof = datetime.now(timezone.utc)
+    category = category_for_stock_type("1")
+
+    with storage.open_writer(asof, "Shanghai_Stocks", categories=[category]) as writer:
+        for batch, source_url, record_asof in fetcher.iter_raw_pages(asof):
+            normalized = [
+                normalize_sse_record(raw, source_url, record_asof, stock_type="1")
+                for raw in batch
+            ]
+            writer.write_records(normalized)
+
+    assert writer.get_total_count() == 3
+
+    snapshot_dir = storage.create_snapshot_dir(asof)
+    jsonl_files = list((snapshot_dir / "Shanghai_Stocks").glob("class=*.jsonl"))
+    assert len(jsonl_files) == 1
+    lines = jsonl_files[0].read_bytes().splitlines()
+    assert [orjson.loads(line)["symbol"] for line in lines] == ["600105", "600106", "600107"]
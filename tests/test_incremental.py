@@ -0,0 +1,110 @@
+"""Incremental (delta) snapshot behavior across consecutive runs.
+
+A delta snapshot only contains new listings, so the symbol base for the
+next incremental run must union deltas back to the last full snapshot —
+otherwise the second run would dedupe against a handful of symbols and
+re-emit the whole universe.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import orjson
+
+from src.fetchers.sse import SseFetcher
+from src.models.config import SseConfig
+from src.normalizers.sse import normalize_sse_record
+from src.storage.universe import UniverseStorage
+
+from .test_fetcher_pipeline import PAGES, StubClient
+
+ASOF_FULL = datetime(2026, 8, 1, tzinfo=timezone.utc)
+ASOF_DELTA1 = datetime(2026, 8, 2, tzinfo=timezone.utc)
+ASOF_DELTA2 = datetime(2026, 8, 3, tzinfo=timezone.utc)
+
+
+def _run_fetch(
+    storage: UniverseStorage,
+    asof: datetime,
+    incremental: bool,
+) -> tuple[list[str], dict]:
+    """Run the CLI fetch flow against the stub pages; return written
+    symbols and the manifest dict."""
+    config = SseConfig(pagination={"page_size": 2}, rate_limit={"page_delay": 0.0})
+
+    prev_symbols = None
+    base_snapshot = None
+    if incremental:
+        loaded = storage.load_latest_symbols("Shanghai_Stocks")
+        if loaded is not None:
+            prev_symbols, base_snapshot = loaded
+
+    fetcher = SseFetcher(config, prev_snapshot_symbols=prev_symbols)
+    fetcher.client = StubClient(PAGES)
+
+    written: list[str] = []
+    with storage.open_writer(asof, "Shanghai_Stocks") as writer:
+        for batch, source_url, record_asof in fetcher.iter_raw_pages(asof):
+            records = [
+                normalize_sse_record(raw, source_url, record_asof) for raw in batch
+            ]
+            writer.write_records(records)
+            written.extend(r.symbol for r in records)
+
+        progress = fetcher.last_progress
+        manifest = storage.build_manifest(
+            exchange="Shanghai_Stocks",
+            asof=asof,
+            config=config,
+            writer=writer,
+            duration_seconds=0.0,
+            skipped_existing=progress.skipped_existing if progress else 0,
+            base_snapshot=base_snapshot,
+        )
+        manifest_path = storage.write_manifest(asof, manifest)
+
+    return written, orjson.loads(manifest_path.read_bytes())
+
+
+def test_repeated_incremental_runs_stay_deltas(tmp_path: Path):
+    storage = UniverseStorage(tmp_path)
+
+    # Full snapshot: the stub universe minus its newest listing
+    full_written, full_manifest = _run_fetch(storage, ASOF_FULL, incremental=False)
+    assert full_manifest["incremental"] is False
+    assert full_manifest["base_snapshot"] is None
+
+    # Pretend 600107 listed after the full snapshot: drop it from disk
+    full_dir = storage.create_snapshot_dir(ASOF_FULL) / "Shanghai_Stocks"
+    for jsonl_path in full_dir.glob("class=*.jsonl"):
+        lines = [
+            line for line in jsonl_path.read_bytes().splitlines()
+            if orjson.loads(line)["symbol"] != "600107"
+        ]
+        jsonl_path.write_bytes(b"".join(line + b"\n" for line in lines))
+
+    # First incremental run: only the new listing is a delta
+    delta1_written, delta1_manifest = _run_fetch(storage, ASOF_DELTA1, incremental=True)
+    assert delta1_written == ["600107"]
+    assert delta1_manifest["incremental"] is True
+    assert delta1_manifest["base_snapshot"] == storage.create_snapshot_dir(ASOF_FULL).name
+    assert delta1_manifest["stats"]["skipped_existing"] == 2
+
+    # Second incremental run: the base must union the delta back to the
+    # full snapshot, so nothing is re-emitted
+    delta2_written, delta2_manifest = _run_fetch(storage, ASOF_DELTA2, incremental=True)
+    assert delta2_written == []
+    assert delta2_manifest["incremental"] is True
+    assert delta2_manifest["stats"]["skipped_existing"] == 3
+
+
+def test_load_latest_symbols_unions_delta_chain(tmp_path: Path):
+    storage = UniverseStorage(tmp_path)
+    assert storage.load_latest_symbols("Shanghai_Stocks") is None
+
+    _run_fetch(storage, ASOF_FULL, incremental=False)
+    loaded = storage.load_latest_symbols("Shanghai_Stocks")
+    assert loaded is not None
+    symbols, base = loaded
+    assert symbols == {"600105", "600106", "600107"}
+    assert base == storage.create_snapshot_dir(ASOF_FULL).name